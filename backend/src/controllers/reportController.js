@@ -738,30 +738,35 @@ const getReportStats = async (req, res) => {
       });
     }
 
-    const stats = await Report.getDashboardStats();
-
-    // Additional analytics
-    const totalReports = await Report.countDocuments();
-    const recentReports = await Report.countDocuments({
-      createdAt: { $gte: new Date(Date.now() - 7 * 24 * 60 * 60 * 1000) },
-    });
-
-    const incidentTypeStats = await Report.aggregate([
-      {
-        $group: {
-          _id: "$incidentType",
-          count: { $sum: 1 },
+    // Queries are independent, so run them concurrently
+    const [
+      stats,
+      totalReports,
+      recentReports,
+      incidentTypeStats,
+      severityStats,
+    ] = await Promise.all([
+      Report.getDashboardStats(),
+      Report.countDocuments(),
+      Report.countDocuments({
+        createdAt: { $gte: new Date(Date.now() - 7 * 24 * 60 * 60 * 1000) },
+      }),
+      Report.aggregate([
+        {
+          $group: {
+            _id: "$incidentType",
+            count: { $sum: 1 },
+          },
         },
-      },
-    ]);
-
-    const severityStats = await Report.aggregate([
-      {
-        $group: {
-          _id: "$severity",
-          count: { $sum: 1 },
+      ]),
+      Report.aggregate([
+        {
+          $group: {
+            _id: "$severity",
+            count: { $sum: 1 },
+          },
         },
-      },
+      ]),
     ]);
 
     res.json({
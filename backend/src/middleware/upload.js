@@ -84,4 +84,4 @@ const handleMulterError = (error, req, res, next) => {
 };
 
 export default upload;
-export { handleMulterError };
+export { fileFilter, handleMulterError };
@@ -145,6 +145,25 @@ router.post("/weekly-digest", auth, async (req, res) => {
     const startDate = new Date();
     startDate.setDate(startDate.getDate() - 7); // Last 7 days
 
+    // Community-wide stats are the same for every recipient, so fetch them once
+    const [communityReports, validatedReports, actionsTaken] =
+      await Promise.all([
+        Report.countDocuments({
+          createdAt: { $gte: startDate },
+        }),
+        Report.countDocuments({
+          status: "approved",
+          createdAt: { $gte: startDate },
+        }),
+        Report.countDocuments({
+          status: "action_taken",
+          createdAt: { $gte: startDate },
+        }),
+      ]);
+
+    // Rank every user in one pass instead of re-sorting per recipient
+    const userRanks = await calculateUserRanks();
+
     for (const user of users) {
       try {
         // Get user's reports from last week
@@ -162,18 +181,10 @@ router.post("/weekly-digest", auth, async (req, res) => {
             if (report.status === "action_taken") points += 25;
             return sum + points;
           }, 0),
-          leaderboardPosition: await calculateUserRank(user._id),
-          communityReports: await Report.countDocuments({
-            createdAt: { $gte: startDate },
-          }),
-          validatedReports: await Report.countDocuments({
-            status: "approved",
-            createdAt: { $gte: startDate },
-          }),
-          actionsTaken: await Report.countDocuments({
-            status: "action_taken",
-            createdAt: { $gte: startDate },
-          }),
+          leaderboardPosition: userRanks.get(user._id.toString()) || 0,
+          communityReports,
+          validatedReports,
+          actionsTaken,
         };
 
         await emailService.sendWeeklyDigest(user, userReports, stats);
@@ -205,18 +216,16 @@ router.post("/weekly-digest", auth, async (req, res) => {
   }
 });
 
-// Helper function to calculate user rank
-async function calculateUserRank(userId) {
+// Helper function to map each user id to their points rank
+async function calculateUserRanks() {
   const { User } = await import("../models/User.js");
 
   const users = await User.find({})
     .sort({ "gamification.points": -1 })
-    .select("_id gamification.points");
+    .select("_id")
+    .lean();
 
-  const userIndex = users.findIndex(
-    (user) => user._id.toString() === userId.toString()
-  );
-  return userIndex + 1;
+  return new Map(users.map((user, index) => [user._id.toString(), index + 1]));
 }
 
 // @desc    Get email service status
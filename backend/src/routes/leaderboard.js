@@ -185,37 +185,44 @@ router.get("/", auth, async (req, res) => {
 // @access  Private
 router.get("/top-contributors", auth, async (req, res) => {
   try {
-    // Top reporters
-    const topReporters = await User.find({ isActive: true, isVerified: true })
-      .sort({ "statistics.reportsSubmitted": -1 })
-      .limit(10)
-      .select(
-        "username fullName statistics.reportsSubmitted gamification.points"
-      );
-
-    // Most accurate reporters
-    const accurateReporters = await User.find({
-      isActive: true,
-      isVerified: true,
-      "statistics.validationAccuracy": { $gt: 0 },
-    })
-      .sort({ "statistics.validationAccuracy": -1 })
-      .limit(10)
-      .select(
-        "username fullName statistics.validationAccuracy statistics.reportsValidated"
-      );
-
-    // Longest streaks
-    const streakLeaders = await User.find({ isActive: true, isVerified: true })
-      .sort({ "gamification.streak.longest": -1 })
-      .limit(10)
-      .select("username fullName gamification.streak");
-
-    // Top point earners
-    const pointLeaders = await User.find({ isActive: true, isVerified: true })
-      .sort({ "gamification.points": -1 })
-      .limit(10)
-      .select("username fullName gamification.points gamification.level");
+    const [topReporters, accurateReporters, streakLeaders, pointLeaders] =
+      await Promise.all([
+        // Top reporters
+        User.find({ isActive: true, isVerified: true })
+          .sort({ "statistics.reportsSubmitted": -1 })
+          .limit(10)
+          .select(
+            "username fullName statistics.reportsSubmitted gamification.points"
+          )
+          .lean(),
+
+        // Most accurate reporters
+        User.find({
+          isActive: true,
+          isVerified: true,
+          "statistics.validationAccuracy": { $gt: 0 },
+        })
+          .sort({ "statistics.validationAccuracy": -1 })
+          .limit(10)
+          .select(
+            "username fullName statistics.validationAccuracy statistics.reportsValidated"
+          )
+          .lean(),
+
+        // Longest streaks
+        User.find({ isActive: true, isVerified: true })
+          .sort({ "gamification.streak.longest": -1 })
+          .limit(10)
+          .select("username fullName gamification.streak")
+          .lean(),
+
+        // Top point earners
+        User.find({ isActive: true, isVerified: true })
+          .sort({ "gamification.points": -1 })
+          .limit(10)
+          .select("username fullName gamification.points gamification.level")
+          .lean(),
+      ]);
 
     res.json({
       success: true,
@@ -290,40 +297,48 @@ router.get("/achievements", auth, async (req, res) => {
 // @access  Private
 router.get("/stats", auth, async (req, res) => {
   try {
-    // Overall statistics
-    const totalUsers = await User.countDocuments({ isActive: true });
-    const totalReports = await Report.countDocuments();
-    const totalPoints = await User.aggregate([
-      { $match: { isActive: true } },
-      { $group: { _id: null, total: { $sum: "$gamification.points" } } },
-    ]);
-
-    // Distribution by level
-    const levelDistribution = await User.aggregate([
-      { $match: { isActive: true } },
-      {
-        $group: {
-          _id: "$gamification.level",
-          count: { $sum: 1 },
-        },
-      },
-      { $sort: { _id: 1 } },
-    ]);
-
-    // Activity this month
     const thisMonth = new Date();
     thisMonth.setDate(1);
     thisMonth.setHours(0, 0, 0, 0);
 
-    const monthlyStats = await Report.aggregate([
-      { $match: { createdAt: { $gte: thisMonth } } },
-      {
-        $group: {
-          _id: { $dayOfMonth: "$createdAt" },
-          count: { $sum: 1 },
+    const [
+      totalUsers,
+      totalReports,
+      totalPoints,
+      levelDistribution,
+      monthlyStats,
+    ] = await Promise.all([
+      // Overall statistics
+      User.countDocuments({ isActive: true }),
+      Report.countDocuments(),
+      User.aggregate([
+        { $match: { isActive: true } },
+        { $group: { _id: null, total: { $sum: "$gamification.points" } } },
+      ]),
+
+      // Distribution by level
+      User.aggregate([
+        { $match: { isActive: true } },
+        {
+          $group: {
+            _id: "$gamification.level",
+            count: { $sum: 1 },
+          },
         },
-      },
-      { $sort: { _id: 1 } },
+        { $sort: { _id: 1 } },
+      ]),
+
+      // Activity this month
+      Report.aggregate([
+        { $match: { createdAt: { $gte: thisMonth } } },
+        {
+          $group: {
+            _id: { $dayOfMonth: "$createdAt" },
+            count: { $sum: 1 },
+          },
+        },
+        { $sort: { _id: 1 } },
+      ]),
     ]);
 
     res.json({
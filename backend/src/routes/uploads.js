@@ -3,6 +3,7 @@ import multer from "multer";
 import path from "path";
 import fs from "fs";
 import auth from "../middleware/auth.js";
+import uploadReportImages, { fileFilter } from "../middleware/upload.js";
 
 const router = express.Router();
 
@@ -17,18 +18,6 @@ const profilesDir = path.join(uploadDir, "profiles");
   }
 });
 
-// Configure storage for report images
-const reportStorage = multer.diskStorage({
-  destination: (req, file, cb) => {
-    cb(null, reportsDir);
-  },
-  filename: (req, file, cb) => {
-    const uniqueSuffix = Date.now() + "-" + Math.round(Math.random() * 1e9);
-    const ext = path.extname(file.originalname);
-    cb(null, `${file.fieldname}-${uniqueSuffix}${ext}`);
-  },
-});
-
 // Configure storage for profile images
 const profileStorage = multer.diskStorage({
   destination: (req, file, cb) => {
@@ -41,27 +30,6 @@ const profileStorage = multer.diskStorage({
   },
 });
 
-// File filter function
-const fileFilter = (req, file, cb) => {
-  const allowedTypes = ["image/jpeg", "image/jpg", "image/png"];
-  
-  if (allowedTypes.includes(file.mimetype)) {
-    cb(null, true);
-  } else {
-    cb(new Error("Invalid file type. Only JPEG, JPG, and PNG images are allowed."), false);
-  }
-};
-
-// Configure multer for reports
-const uploadReportImages = multer({
-  storage: reportStorage,
-  limits: {
-    fileSize: 10 * 1024 * 1024, // 10MB
-    files: 5, // Maximum 5 files
-  },
-  fileFilter: fileFilter,
-});
-
 // Configure multer for profiles
 const uploadProfileImage = multer({
   storage: profileStorage,
@@ -149,7 +117,7 @@ router.post("/profile-image", auth, uploadProfileImage.single("image"), (req, re
 // @route   DELETE /api/uploads/:type/:filename
 // @desc    Delete uploaded file
 // @access  Private
-router.delete("/:type/:filename", auth, (req, res) => {
+router.delete("/:type/:filename", auth, async (req, res) => {
   try {
     const { type, filename } = req.params;
     
@@ -163,17 +131,19 @@ router.delete("/:type/:filename", auth, (req, res) => {
 
     const filePath = path.join(uploadDir, type, filename);
 
-    // Check if file exists
-    if (!fs.existsSync(filePath)) {
-      return res.status(404).json({
-        success: false,
-        message: "File not found",
-      });
+    // Delete file, treating a missing file as not found
+    try {
+      await fs.promises.unlink(filePath);
+    } catch (unlinkError) {
+      if (unlinkError.code === "ENOENT") {
+        return res.status(404).json({
+          success: false,
+          message: "File not found",
+        });
+      }
+      throw unlinkError;
     }
 
-    // Delete file
-    fs.unlinkSync(filePath);
-
     res.json({
       success: true,
       message: "File deleted successfully",